@@ -2,4 +2,7 @@
 DEFAULT_PDF_DIR = "./wechat_pdf"
 SYSTEM_TITLE = "道路塌陷应急管理系统"
 WINDOW_SIZE = (1200, 800)
-LOG_LIST_MAX_WIDTH_OFFSET = 80  # 日志气泡宽度偏移量
\ No newline at end of file
+LOG_LIST_MAX_WIDTH_OFFSET = 80  # 日志气泡宽度偏移量
+LOG_FLUSH_INTERVAL_MS = 100  # 日志批量刷新间隔（毫秒）
+LOG_MAX_ITEMS = 5000  # 日志面板最多保留的条数
+LOG_FLUSH_BATCH = 50  # 单次刷新最多追加的日志条数
\ No newline at end of file
@@ -1,5 +1,8 @@
 import sys
 import os
+import heapq
+import collections
+from pathlib import Path
 # 确保PATH环境变量存在，若不存在则从系统中获取（适用于Windows）
 if "PATH" not in os.environ:
     if sys.platform.startswith("win32"):
@@ -16,41 +19,194 @@ if "PATH" not in os.environ:
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
-    QLabel, QPushButton, QLineEdit, QSpinBox, QDateEdit, QTextEdit,
+    QLabel, QPushButton, QLineEdit, QSpinBox, QDateEdit, QTextEdit, QFormLayout,
     QListWidget, QListWidgetItem, QProgressBar, QGroupBox, QFileDialog,
     QMessageBox, QFrame, QCheckBox
 )
 from PyQt5.QtCore import (
-    Qt, QDate, QDateTime, QEvent, QTimer
+    Qt, QDate, QDateTime, QEvent, QTimer, QThreadPool
 )
 
 # 导入自定义模块
-from spider.wechat.run import WeChatSpiderRunner
-from threads import BrowserInstaller, SpiderWorker
+# 注意：spider.wechat.run 会连带导入 playwright/selenium，开销较大，
+# 改为窗口显示后再延迟导入（见 _deferred_init）
+from threads import BrowserInstaller, SpiderWorker, browser_already_installed
 from widgets import ChatBubble
-from config import DEFAULT_PDF_DIR, SYSTEM_TITLE, WINDOW_SIZE, LOG_LIST_MAX_WIDTH_OFFSET
+from config import (
+    DEFAULT_PDF_DIR, SYSTEM_TITLE, WINDOW_SIZE, LOG_LIST_MAX_WIDTH_OFFSET,
+    LOG_FLUSH_INTERVAL_MS, LOG_MAX_ITEMS, LOG_FLUSH_BATCH
+)
+
+
+# 爬取配置确认消息模板（模块级常量，点击时只做一次format_map）
+_SCRAPE_CONFIRM_TMPL = """
+开始爬取配置：
+- 目标公众号：{name}
+- 爬取页数：{pages}
+- 时间范围：{start_date} 至 {end_date}
+{keyword_info}
+- 生成PDF：{pdf}
+- PDF保存目录：{pdf_dir}
+        """
+
+# 全局样式表：模块级常量，应用启动时在QApplication上解析一次，
+# 所有窗口共享同一份已解析的样式
+_APP_QSS = """
+        /* 全局字体 */
+        * {
+            font-family: "Microsoft YaHei", "SimSun", sans-serif;
+        }
+
+        QMainWindow { background-color: #f1f5f9; }
+
+        /* 系统顶部标题栏 */
+        QFrame#SystemHeaderFrame {
+            background-color: #0f2c52;
+            border: none;
+        }
+        QLabel#SystemHeaderTitle {
+            color: #ffffff;
+            font-size: 18px;
+            font-weight: bold;
+        }
+
+        /* 左侧日志区 */
+        QListWidget#LogList {
+            background-color: #94a3b8;
+            border-radius: 8px;
+            border: none;
+        }
+
+        /* 功能按钮 */
+        QPushButton {
+            background-color: #0f2c52;
+            color: #ffffff;
+            border-radius: 6px;
+            border: none;
+            font-weight: bold;
+            font-size: 16px;
+        }
+        QPushButton:hover { background-color: #1e40af; }
+        QPushButton:disabled { background-color: #64748b; }
+
+        /* 输入控件 */
+        QLineEdit, QSpinBox, QDateEdit, QTextEdit {
+            border: 1px solid #e2e8f0;
+            border-radius: 4px;
+            padding: 8px;
+            background-color: #ffffff;
+            color: #333;
+            font-size: 15px;
+        }
+
+        /* 复选框 */
+        QCheckBox {
+            color: #ffffff;
+            font-size: 15px;
+        }
+
+        /* 进度条 */
+        QProgressBar {
+            border: none;
+            background-color: #e2e8f0;
+            border-radius: 6px;
+            height: 12px;
+        }
+        QProgressBar::chunk {
+            background-color: #3b82f6;
+            border-radius: 6px;
+        }
+
+        /* 菜单按钮 */
+        QPushButton#HeaderMenuBtn {
+            color: white; font-size: 22px;
+            background: transparent; border: none;
+        }
+
+        /* 日期选择框 */
+        QDateEdit {
+            min-width: 140px;
+        }
+
+        /* 日志气泡：按objectName匹配，避免每条日志重新解析内联样式
+           （图标改为预渲染位图，不再走QSS绘制） */
+        QLabel#ChatBubbleMsg {
+            padding: 12px 18px;
+            border-radius: 8px;
+            line-height: 1.5;
+            background-color: #f1f5f9;
+            color: #333333;
+        }
+
+        /* 登录状态标签：颜色由动态属性state驱动，切换时只需repolish */
+        QLabel#LoginStatusLabel {
+            font-size: 14px;
+            margin-top: 10px;
+            font-weight: 500;
+        }
+        QLabel#LoginStatusLabel[state="off"] { color: #ef4444; }
+        QLabel#LoginStatusLabel[state="pending"] { color: #f97316; }
+        QLabel#LoginStatusLabel[state="ok"] { color: #10b981; }
+"""
+
+
+# 气泡尺寸缓存：同一文本在同一宽度下的排版结果不变，
+# 命中时跳过Qt对相同内容的重复文本shaping与断行
+_BUBBLE_SIZE_CACHE = {}
+_BUBBLE_SIZE_CACHE_MAX = 1024
+
+
+def _bubble_size_hint(bubble, msg, width):
+    """获取气泡在给定宽度下的尺寸（带LRU式缓存）"""
+    key = (msg, width)
+    size = _BUBBLE_SIZE_CACHE.get(key)
+    if size is None:
+        size = bubble.sizeHint()
+        if len(_BUBBLE_SIZE_CACHE) >= _BUBBLE_SIZE_CACHE_MAX:
+            _BUBBLE_SIZE_CACHE.clear()
+        _BUBBLE_SIZE_CACHE[key] = size
+    return size
 
 
 class WeChatSpiderUI(QMainWindow):
     """主窗口类"""
     def __init__(self):
         super().__init__()
-        self.spider_runner = WeChatSpiderRunner()  # 初始化爬虫核心
+        self.spider_runner = None  # 爬虫核心延迟加载（见 _deferred_init）
         self.current_account = None
         self.pdf_dir = DEFAULT_PDF_DIR
         self.login_status = False
+        # 全局线程池：复用工作线程，避免每次任务都新建QThread
+        self.thread_pool = QThreadPool.globalInstance()
+        self.thread_pool.setMaxThreadCount(2)
         self.init_ui()
         self.timer_tasks = []
+        # 定时任务用最小堆调度：singleShot精确睡到下一个到期任务，
+        # 取代每分钟一次的全量轮询
+        self._task_heap = []
+        self._task_map = {}
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.check_timer_tasks)
 
-        # 启动浏览器安装线程
-        self.installer_thread = BrowserInstaller()
-        self.installer_thread.log_signal.connect(self.add_log_msg)
-        self.installer_thread.start()
+        # 提交浏览器安装任务（本地缓存命中时无需安装，跳过任务提交）
+        if browser_already_installed():
+            self.add_log_msg("系统", "✅ 浏览器组件就绪（使用本地缓存）")
+        else:
+            self.installer_task = BrowserInstaller()
+            self.installer_task.signals.log_signal.connect(self.add_log_msg)
+            self.thread_pool.start(self.installer_task)
 
         self.add_log_msg("系统", "📌 系统初始化完成\n当前微信状态：未登录\n请先完成微信登录，再进行公众号搜索/爬取操作")
 
+        # 首帧绘制后再加载爬虫核心，避免重型导入阻塞窗口显示
+        QTimer.singleShot(0, self._deferred_init)
+
+    def _deferred_init(self):
+        """延迟加载爬虫核心（playwright/selenium导入链较重）"""
+        from spider.wechat.run import WeChatSpiderRunner
+        self.spider_runner = WeChatSpiderRunner()
+
     def init_ui(self):
         """初始化UI界面"""
         self.setWindowTitle(SYSTEM_TITLE)
@@ -64,7 +220,18 @@ class WeChatSpiderUI(QMainWindow):
 
         self.create_system_header()
         self.create_content_area()
-        self.apply_styles()
+
+        # 窗口缩放防抖：Resize风暴结束后才重排日志气泡
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._apply_bubble_widths)
+
+        # 日志批量刷新：消息先入队，由定时器合并为一次布局与滚动
+        self._log_buf = collections.deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_logs)
+        self._log_timer.start()
 
     def create_system_header(self):
         """创建系统头部"""
@@ -107,18 +274,27 @@ class WeChatSpiderUI(QMainWindow):
         parent_layout.addWidget(self.chat_list, stretch=6)
 
     def eventFilter(self, obj, event):
-        """事件过滤器（调整日志气泡大小）"""
+        """事件过滤器（调整日志气泡大小）
+
+        拖拽窗口时Resize事件以像素级频率触发，逐条重排气泡是O(n)开销，
+        这里只重启防抖定时器，整个手势结束后统一重排一次。
+        """
         if obj == self.chat_list and event.type() == QEvent.Resize:
-            for i in range(self.chat_list.count()):
-                item = self.chat_list.item(i)
-                bubble = self.chat_list.itemWidget(item)
-                if bubble:
-                    max_width = self.chat_list.width() - LOG_LIST_MAX_WIDTH_OFFSET
-                    bubble.msg_label.setMaximumWidth(max_width)
-                    item.setSizeHint(bubble.sizeHint())
-            return True
+            self._resize_timer.start(50)
+            return False
         return super().eventFilter(obj, event)
 
+    def _apply_bubble_widths(self):
+        """按当前列表宽度重排所有日志气泡（防抖后执行，宽度未变的跳过）"""
+        max_width = self.chat_list.width() - LOG_LIST_MAX_WIDTH_OFFSET
+        for i in range(self.chat_list.count()):
+            item = self.chat_list.item(i)
+            bubble = self.chat_list.itemWidget(item)
+            if bubble and getattr(bubble, '_last_width', None) != max_width:
+                bubble.msg_label.setMaximumWidth(max_width)
+                item.setSizeHint(_bubble_size_hint(bubble, bubble.msg_label.text(), max_width))
+                bubble._last_width = max_width
+
     def create_right_function_cards(self, parent_layout):
         """创建右侧功能卡片"""
         right_widget = QWidget()
@@ -133,12 +309,8 @@ class WeChatSpiderUI(QMainWindow):
         self.login_btn.setFixedHeight(45)
         self.login_btn.clicked.connect(self.start_login)
         self.login_status_label = QLabel("当前状态：未登录 🚫")
-        self.login_status_label.setStyleSheet("""
-            color: #ef4444; 
-            font-size: 14px; 
-            margin-top: 10px;
-            font-weight: 500;
-        """)
+        self.login_status_label.setObjectName("LoginStatusLabel")
+        self.login_status_label.setProperty("state", "off")
         c1_layout.addWidget(self.login_btn)
         c1_layout.addWidget(self.login_status_label)
         card1.setLayout(c1_layout)
@@ -163,39 +335,35 @@ class WeChatSpiderUI(QMainWindow):
         c3_layout = QVBoxLayout()
         c3_layout.setSpacing(15)
 
-        # 关键词行
-        keyword_row = QHBoxLayout()
-        keyword_row.addWidget(QLabel("筛选关键词"))
+        # 表单区：QFormLayout一次建好标签列，省去逐行的QHBoxLayout嵌套
+        form3 = QFormLayout()
+        form3.setSpacing(15)
+
         self.keywords_edit = QLineEdit()
         self.keywords_edit.setPlaceholderText("多个关键词用逗号分隔")
         self.keywords_edit.setFixedHeight(40)
-        keyword_row.addWidget(self.keywords_edit)
-        c3_layout.addLayout(keyword_row)
+        form3.addRow("筛选关键词", self.keywords_edit)
 
-        # 爬取页数行
-        row1 = QHBoxLayout()
-        row1.addWidget(QLabel("爬取页数"))
         self.page_spin = QSpinBox()
         self.page_spin.setRange(1, 50)
         self.page_spin.setValue(1)
-        row1.addWidget(self.page_spin)
-        c3_layout.addLayout(row1)
+        form3.addRow("爬取页数", self.page_spin)
 
-        # 日期范围行
-        row2 = QHBoxLayout()
-        row2.addWidget(QLabel("日期范围"))
+        date_row = QHBoxLayout()
         self.start_date_edit = QDateEdit()
         self.start_date_edit.setDate(QDate.currentDate())
         self.start_date_edit.setDisplayFormat("yyyy-MM-dd")
         self.start_date_edit.setFixedHeight(40)
-        row2.addWidget(self.start_date_edit)
-        row2.addWidget(QLabel("至"))
+        date_row.addWidget(self.start_date_edit)
+        date_row.addWidget(QLabel("至"))
         self.end_date_edit = QDateEdit()
         self.end_date_edit.setDate(QDate.currentDate())
         self.end_date_edit.setDisplayFormat("yyyy-MM-dd")
         self.end_date_edit.setFixedHeight(40)
-        row2.addWidget(self.end_date_edit)
-        c3_layout.addLayout(row2)
+        date_row.addWidget(self.end_date_edit)
+        form3.addRow("日期范围", date_row)
+
+        c3_layout.addLayout(form3)
 
         # PDF相关
         self.pdf_check = QCheckBox("生成文章PDF文件")
@@ -248,36 +416,33 @@ class WeChatSpiderUI(QMainWindow):
         c4_layout = QVBoxLayout()
         c4_layout.setSpacing(15)
 
+        form4 = QFormLayout()
+        form4.setSpacing(15)
+
         self.task_accounts = QTextEdit()
         self.task_accounts.setPlaceholderText("请输入要定时爬取的公众号，每行一个")
         self.task_accounts.setFixedHeight(80)
-        c4_layout.addWidget(QLabel("公众号列表"))
-        c4_layout.addWidget(self.task_accounts)
+        form4.addRow("公众号列表", self.task_accounts)
 
         self.task_keywords = QLineEdit()
         self.task_keywords.setPlaceholderText("定时任务筛选关键词，多个用逗号分隔")
         self.task_keywords.setFixedHeight(40)
-        c4_layout.addWidget(QLabel("筛选关键词"))
-        c4_layout.addWidget(self.task_keywords)
+        form4.addRow("筛选关键词", self.task_keywords)
 
-        # 频率设置
-        freq_layout = QHBoxLayout()
-        freq_layout.addWidget(QLabel("爬取频率"))
+        freq_row = QHBoxLayout()
         self.freq_spin = QSpinBox()
         self.freq_spin.setRange(1, 24)
         self.freq_spin.setValue(1)
-        freq_layout.addWidget(self.freq_spin)
-        freq_layout.addWidget(QLabel("小时/次"))
-        c4_layout.addLayout(freq_layout)
+        freq_row.addWidget(self.freq_spin)
+        freq_row.addWidget(QLabel("小时/次"))
+        form4.addRow("爬取频率", freq_row)
 
-        # 开始时间
-        time_layout = QHBoxLayout()
-        time_layout.addWidget(QLabel("开始时间"))
         self.task_datetime = QDateEdit()
         self.task_datetime.setDateTime(QDateTime.currentDateTime())
         self.task_datetime.setDisplayFormat("yyyy-MM-dd HH:mm")
-        time_layout.addWidget(self.task_datetime)
-        c4_layout.addLayout(time_layout)
+        form4.addRow("开始时间", self.task_datetime)
+
+        c4_layout.addLayout(form4)
 
         # 任务按钮
         btn_layout = QHBoxLayout()
@@ -316,15 +481,35 @@ class WeChatSpiderUI(QMainWindow):
         return box
 
     def add_log_msg(self, role, msg):
-        """添加日志消息到界面"""
-        item = QListWidgetItem(self.chat_list)
-        bubble = ChatBubble(role, msg)
+        """添加日志消息到界面（先入队，由定时器批量刷新）"""
+        self._log_buf.append((role, msg))
+
+    def _flush_logs(self):
+        """批量刷新队列中的日志，N条消息合并为一次布局与滚动"""
+        if not self._log_buf:
+            return
 
         max_width = self.chat_list.width() - LOG_LIST_MAX_WIDTH_OFFSET
-        bubble.msg_label.setMaximumWidth(max_width)
+        # 暂停重绘：本轮追加的所有条目合并为一次viewport更新
+        self.chat_list.setUpdatesEnabled(False)
+        try:
+            # 单轮最多消费LOG_FLUSH_BATCH条，消息洪峰时也不会卡住事件循环
+            for _ in range(min(len(self._log_buf), LOG_FLUSH_BATCH)):
+                role, msg = self._log_buf.popleft()
+                item = QListWidgetItem(self.chat_list)
+                bubble = ChatBubble(role, msg)
+                bubble.msg_label.setMaximumWidth(max_width)
+                item.setSizeHint(_bubble_size_hint(bubble, msg, max_width))
+                bubble._last_width = max_width
+                self.chat_list.setItemWidget(item, bubble)
+
+            # 限制日志条数，避免长时间爬取导致内存无限增长
+            # （takeItem会deleteLater对应的气泡，不可回收复用）
+            while self.chat_list.count() > LOG_MAX_ITEMS:
+                self.chat_list.takeItem(0)
+        finally:
+            self.chat_list.setUpdatesEnabled(True)
 
-        item.setSizeHint(bubble.sizeHint())
-        self.chat_list.setItemWidget(item, bubble)
         self.chat_list.scrollToBottom()
 
     # ------------------------------
@@ -332,43 +517,37 @@ class WeChatSpiderUI(QMainWindow):
     # ------------------------------
     def start_login(self):
         """启动登录流程"""
+        if self.spider_runner is None:
+            self.add_log_msg("系统", "⚠️ 爬虫核心正在加载，请稍候再试")
+            return
+
         self.add_log_msg("系统", "📢 请准备扫码登录")
         self.login_btn.setEnabled(False)
-        self.login_status_label.setText("当前状态：登录中 🕒")
-        self.login_status_label.setStyleSheet("""
-            color: #f97316; 
-            font-size: 14px; 
-            margin-top: 10px;
-            font-weight: 500;
-        """)
+        self._set_login_state("pending", "当前状态：登录中 🕒")
 
         self.worker = SpiderWorker(self.spider_runner, "login")
-        self.worker.log_signal.connect(self.add_log_msg)
-        self.worker.finish_signal.connect(self.on_login_finished)
-        self.worker.start()
-
-    def on_login_finished(self, success, msg, data):
+        self.worker.signals.log_signal.connect(self.add_log_msg)
+        self.worker.signals.finish_signal.connect(self.on_login_finished)
+        self.thread_pool.start(self.worker)
+
+    def _set_login_state(self, state, text):
+        """切换登录状态标签（改动态属性后repolish，不重新解析样式表）"""
+        self.login_status_label.setText(text)
+        self.login_status_label.setProperty("state", state)
+        style = self.login_status_label.style()
+        style.unpolish(self.login_status_label)
+        style.polish(self.login_status_label)
+
+    def on_login_finished(self, result):
         """登录完成回调"""
         self.login_btn.setEnabled(True)
-        if success:
+        if result.success:
             self.login_status = True
-            self.login_status_label.setText("当前状态：已登录 ✅")
-            self.login_status_label.setStyleSheet("""
-                color: #10b981; 
-                font-size: 14px; 
-                margin-top: 10px;
-                font-weight: 500;
-            """)
+            self._set_login_state("ok", "当前状态：已登录 ✅")
             self.add_log_msg("系统", "🎉 微信登录成功，可进行公众号搜索/爬取操作")
         else:
             self.login_status = False
-            self.login_status_label.setText("当前状态：未登录 🚫")
-            self.login_status_label.setStyleSheet("""
-                color: #ef4444; 
-                font-size: 14px; 
-                margin-top: 10px;
-                font-weight: 500;
-            """)
+            self._set_login_state("off", "当前状态：未登录 🚫")
             self.add_log_msg("系统", "❌ 微信登录失败，请重新点击「扫码登录」重试")
 
     # ------------------------------
@@ -376,6 +555,10 @@ class WeChatSpiderUI(QMainWindow):
     # ------------------------------
     def start_search(self):
         """启动公众号搜索"""
+        if self.spider_runner is None:
+            self.add_log_msg("系统", "⚠️ 爬虫核心正在加载，请稍候再试")
+            return
+
         if not self.login_status:
             self.add_log_msg("系统", "⚠️ 操作失败：未登录微信")
             QMessageBox.warning(self, "权限提示", "请先完成微信扫码登录，再进行公众号搜索！")
@@ -389,17 +572,17 @@ class WeChatSpiderUI(QMainWindow):
         self.add_log_msg("用户", f"发起搜索：公众号名称 = {name}")
         self.search_btn.setEnabled(False)
         self.worker = SpiderWorker(self.spider_runner, "search", account_name=name)
-        self.worker.log_signal.connect(self.add_log_msg)
-        self.worker.finish_signal.connect(self.on_search_finished)
-        self.worker.start()
+        self.worker.signals.log_signal.connect(self.add_log_msg)
+        self.worker.signals.finish_signal.connect(self.on_search_finished)
+        self.thread_pool.start(self.worker)
 
-    def on_search_finished(self, success, msg, data):
+    def on_search_finished(self, result):
         """搜索完成回调"""
         self.search_btn.setEnabled(True)
-        if success and isinstance(data, list):
-            matched_count = len(data)
+        if result.success and isinstance(result.data, list):
+            matched_count = len(result.data)
             if matched_count > 0:
-                self.current_account = data[0]
+                self.current_account = result.data[0]
                 selected_account = self.current_account
                 self.add_log_msg(
                     "系统",
@@ -411,7 +594,7 @@ class WeChatSpiderUI(QMainWindow):
                 self.add_log_msg("系统", "❌ 搜索失败：未找到匹配的公众号")
         else:
             self.current_account = None
-            self.add_log_msg("系统", f"❌ 搜索失败：{msg}")
+            self.add_log_msg("系统", f"❌ 搜索失败：{result.msg}")
 
     # ------------------------------
     # 功能逻辑：爬取相关
@@ -420,12 +603,18 @@ class WeChatSpiderUI(QMainWindow):
         """选择PDF保存目录"""
         path = QFileDialog.getExistingDirectory(self, "选择PDF保存目录")
         if path:
-            self.pdf_dir = path
-            self.dir_btn.setText(f"已选: .../{os.path.basename(path)}")
-            self.add_log_msg("系统", f"📁 PDF保存目录已设置：{path}")
+            # 选择时解析一次绝对路径，后续提交爬取任务直接复用
+            resolved = Path(path).resolve(strict=False)
+            self.pdf_dir = str(resolved)
+            self.dir_btn.setText(f"已选: .../{resolved.name}")
+            self.add_log_msg("系统", f"📁 PDF保存目录已设置：{resolved}")
 
     def start_scrape(self):
         """启动爬取任务"""
+        if self.spider_runner is None:
+            self.add_log_msg("系统", "⚠️ 爬虫核心正在加载，请稍候再试")
+            return
+
         if not self.login_status:
             self.add_log_msg("系统", "⚠️ 操作失败：未登录微信")
             QMessageBox.warning(self, "权限提示", "请先完成微信扫码登录，再进行文章爬取！")
@@ -452,16 +641,17 @@ class WeChatSpiderUI(QMainWindow):
             QMessageBox.warning(self, "参数提示", "开始日期不能晚于结束日期，请修正！")
             return
 
-        keyword_info = f"- 筛选关键词：{', '.join(keyword_list)}" if keyword_list else "- 未设置筛选关键词"
-        self.add_log_msg("用户", f"""
-开始爬取配置：
-- 目标公众号：{self.current_account['wpub_name']}
-- 爬取页数：{pages}
-- 时间范围：{start_date} 至 {end_date}
-{keyword_info}
-- 生成PDF：{"是" if generate_pdf else "否"}
-- PDF保存目录：{pdf_dir}
-        """)
+        kw_joined = ', '.join(keyword_list)
+        keyword_info = f"- 筛选关键词：{kw_joined}" if keyword_list else "- 未设置筛选关键词"
+        self.add_log_msg("用户", _SCRAPE_CONFIRM_TMPL.format_map({
+            "name": self.current_account['wpub_name'],
+            "pages": pages,
+            "start_date": start_date,
+            "end_date": end_date,
+            "keyword_info": keyword_info,
+            "pdf": "是" if generate_pdf else "否",
+            "pdf_dir": pdf_dir,
+        }))
 
         # 更新UI状态
         self.scrape_btn.setEnabled(False)
@@ -479,10 +669,10 @@ class WeChatSpiderUI(QMainWindow):
             pdf_dir=pdf_dir,
             keywords=keyword_list
         )
-        self.worker.log_signal.connect(self.add_log_msg)
-        self.worker.progress_signal.connect(self.update_progress)
-        self.worker.finish_signal.connect(self.on_scrape_finished)
-        self.worker.start()
+        self.worker.signals.log_signal.connect(self.add_log_msg)
+        self.worker.signals.progress_log_signal.connect(self._on_progress_log)
+        self.worker.signals.finish_signal.connect(self.on_scrape_finished)
+        self.thread_pool.start(self.worker)
 
     def stop_scrape(self):
         """停止爬取任务"""
@@ -495,18 +685,23 @@ class WeChatSpiderUI(QMainWindow):
         self.pbar.setValue(val)
         self.progress_percent.setText(f"{val}%")
 
-    def on_scrape_finished(self, success, msg, data):
+    def _on_progress_log(self, val, role, msg):
+        """进度+日志合并信号的槽：一次排队同时更新进度条和日志"""
+        self.update_progress(val)
+        self.add_log_msg(role, msg)
+
+    def on_scrape_finished(self, result):
         """爬取完成回调"""
         self.scrape_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
 
-        if success:
-            if "已停止" in msg:
-                self.add_log_msg("系统", f"⚠️ {msg}")
+        if result.success:
+            if "已停止" in result.msg:
+                self.add_log_msg("系统", f"⚠️ {result.msg}")
             else:
                 self.add_log_msg("系统", "✅ 爬取完成：所有文章已处理完毕（含PDF生成）")
         else:
-            self.add_log_msg("系统", f"❌ 爬取失败：{msg}")
+            self.add_log_msg("系统", f"❌ 爬取失败：{result.msg}")
 
     # ------------------------------
     # 功能逻辑：定时任务相关
@@ -526,7 +721,10 @@ class WeChatSpiderUI(QMainWindow):
         task_keywords = self.task_keywords.text().strip()
         task_keyword_list = [k.strip() for k in task_keywords.split(',') if k.strip()]
 
-        accounts = [acc.strip() for acc in accounts_text.split("\n") if acc.strip()]
+        # splitlines兼容\r\n；dict.fromkeys保序去重，重复公众号不重复爬
+        accounts = list(dict.fromkeys(
+            line.strip() for line in accounts_text.splitlines() if line.strip()
+        ))
         freq = self.freq_spin.value()
         start_time = self.task_datetime.dateTime()
 
@@ -540,39 +738,46 @@ class WeChatSpiderUI(QMainWindow):
             "accounts": accounts,
             "keywords": task_keyword_list,
             "frequency": freq,
+            "freq_secs": freq * 3600,
+            # 展示用的拼接串只算一次，查看任务时无需重复join
+            "keywords_joined": ', '.join(task_keyword_list) or '无',
+            "accounts_joined": ', '.join(accounts),
             "start_time": start_time,
+            "next_run_epoch": start_time.toSecsSinceEpoch(),
             "last_run": None,
             "status": "等待中"
         }
 
         self.timer_tasks.append(task)
-        keyword_info = f"关键词: {', '.join(task_keyword_list)}" if task_keyword_list else "未设置关键词"
+        self._task_map[task_id] = task
+        heapq.heappush(self._task_heap, (task["next_run_epoch"], task_id))
+        keyword_info = f"关键词: {task['keywords_joined']}" if task_keyword_list else "未设置关键词"
         self.add_log_msg("系统",
-                         f"✅ 定时任务添加成功 (ID: {task_id})\n公众号: {', '.join(accounts)}\n{keyword_info}\n频率: 每{freq}小时")
+                         f"✅ 定时任务添加成功 (ID: {task_id})\n公众号: {task['accounts_joined']}\n{keyword_info}\n频率: 每{freq}小时")
 
-        if not self.timer.isActive():
-            self.timer.start(60000)  # 每分钟检查一次
-
-    def check_timer_tasks(self):
-        """检查并执行定时任务"""
-        current_time = QDateTime.currentDateTime()
+        self._reschedule_timer()
 
-        for task in self.timer_tasks:
-            if task["status"] not in ("等待中", "运行中"):
-                continue
+    def _reschedule_timer(self):
+        """按堆顶任务的到期时间安排下一次唤醒"""
+        if not self._task_heap:
+            return
+        next_ts = self._task_heap[0][0]
+        delay_ms = max(0, (next_ts - QDateTime.currentSecsSinceEpoch()) * 1000)
+        # 上限一天：防止超长间隔溢出QTimer的毫秒范围，到点后会重新排程
+        self.timer.start(int(min(delay_ms, 86400000)))
 
-            should_run = False
-            if task["last_run"] is None:
-                if current_time >= task["start_time"]:
-                    should_run = True
-            else:
-                next_run_time = task["last_run"].addSecs(task["frequency"] * 3600)
-                if current_time >= next_run_time:
-                    should_run = True
+    def check_timer_tasks(self):
+        """弹出所有已到期的定时任务并执行"""
+        now = QDateTime.currentSecsSinceEpoch()
 
-            if should_run:
+        while self._task_heap and self._task_heap[0][0] <= now:
+            _, task_id = heapq.heappop(self._task_heap)
+            task = self._task_map.get(task_id)
+            if task and task["status"] == "等待中":
                 self.run_timer_task(task)
 
+        self._reschedule_timer()
+
     def run_timer_task(self, task):
         """执行定时任务"""
         task["status"] = "运行中"
@@ -588,21 +793,27 @@ class WeChatSpiderUI(QMainWindow):
             pdf_dir=self.pdf_dir,
             keywords=task["keywords"]
         )
-        self.worker.log_signal.connect(self.add_log_msg)
-        self.worker.progress_signal.connect(self.update_progress)
-        self.worker.finish_signal.connect(lambda s, m, d: self.on_task_finished(s, m, d, task))
-        self.worker.start()
-
-    def on_task_finished(self, success, msg, data, task):
-        """定时任务完成回调"""
-        task["last_run"] = QDateTime.currentDateTime()
+        self.worker.signals.log_signal.connect(self.add_log_msg)
+        self.worker.signals.progress_log_signal.connect(self._on_progress_log)
+        self.worker.signals.finish_signal.connect(lambda r: self.on_task_finished(r, task))
+        self.thread_pool.start(self.worker)
+
+    def on_task_finished(self, result, task):
+        """定时任务完成回调（把下一轮执行时间压回调度堆）"""
+        # 全程整型epoch运算，仅在格式化展示时构造一次QDateTime
+        now_epoch = QDateTime.currentSecsSinceEpoch()
+        task["last_run"] = QDateTime.fromSecsSinceEpoch(now_epoch)
         task["status"] = "等待中"
+        task["next_run_epoch"] = now_epoch + task["freq_secs"]
+        heapq.heappush(self._task_heap, (task["next_run_epoch"], task["id"]))
+        self._reschedule_timer()
 
-        if success:
+        if result.success:
+            next_run_str = QDateTime.fromSecsSinceEpoch(task["next_run_epoch"]).toString('yyyy-MM-dd HH:mm')
             self.add_log_msg("系统",
-                             f"✅ 定时任务完成 (ID: {task['id']})\n下次运行时间: {task['last_run'].addSecs(task['frequency'] * 3600).toString('yyyy-MM-dd HH:mm')}")
+                             f"✅ 定时任务完成 (ID: {task['id']})\n下次运行时间: {next_run_str}")
         else:
-            self.add_log_msg("系统", f"❌ 定时任务失败 (ID: {task['id']}): {msg}")
+            self.add_log_msg("系统", f"❌ 定时任务失败 (ID: {task['id']}): {result.msg}")
 
     def show_timer_tasks(self):
         """显示当前定时任务列表"""
@@ -612,10 +823,9 @@ class WeChatSpiderUI(QMainWindow):
 
         task_info = "当前定时任务列表:\n\n"
         for task in self.timer_tasks:
-            keywords = ', '.join(task['keywords']) if task['keywords'] else '无'
             task_info += f"任务ID: {task['id']}\n"
-            task_info += f"公众号: {', '.join(task['accounts'])}\n"
-            task_info += f"筛选关键词: {keywords}\n"
+            task_info += f"公众号: {task['accounts_joined']}\n"
+            task_info += f"筛选关键词: {task['keywords_joined']}\n"
             task_info += f"频率: 每{task['frequency']}小时\n"
             task_info += f"开始时间: {task['start_time'].toString('yyyy-MM-dd HH:mm')}\n"
             task_info += f"最后运行: {task['last_run'].toString('yyyy-MM-dd HH:mm') if task['last_run'] else '未运行'}\n"
@@ -623,93 +833,10 @@ class WeChatSpiderUI(QMainWindow):
 
         QMessageBox.information(self, "定时任务", task_info)
 
-    # ------------------------------
-    # 样式设置
-    # ------------------------------
-    def apply_styles(self):
-        """应用全局样式表"""
-        qss = """
-        /* 全局字体 */
-        * {
-            font-family: "Microsoft YaHei", "SimSun", sans-serif;
-        }
-
-        QMainWindow { background-color: #f1f5f9; }
-
-        /* 系统顶部标题栏 */
-        QFrame#SystemHeaderFrame {
-            background-color: #0f2c52;
-            border: none;
-        }
-        QLabel#SystemHeaderTitle {
-            color: #ffffff;
-            font-size: 18px;
-            font-weight: bold;
-        }
-
-        /* 左侧日志区 */
-        QListWidget#LogList {
-            background-color: #94a3b8;
-            border-radius: 8px;
-            border: none;
-        }
-
-        /* 功能按钮 */
-        QPushButton {
-            background-color: #0f2c52;
-            color: #ffffff;
-            border-radius: 6px;
-            border: none;
-            font-weight: bold;
-            font-size: 16px;
-        }
-        QPushButton:hover { background-color: #1e40af; }
-        QPushButton:disabled { background-color: #64748b; }
-
-        /* 输入控件 */
-        QLineEdit, QSpinBox, QDateEdit, QTextEdit {
-            border: 1px solid #e2e8f0;
-            border-radius: 4px;
-            padding: 8px;
-            background-color: #ffffff;
-            color: #333;
-            font-size: 15px;
-        }
-
-        /* 复选框 */
-        QCheckBox {
-            color: #ffffff;
-            font-size: 15px;
-        }
-
-        /* 进度条 */
-        QProgressBar {
-            border: none;
-            background-color: #e2e8f0;
-            border-radius: 6px;
-            height: 12px;
-        }
-        QProgressBar::chunk {
-            background-color: #3b82f6;
-            border-radius: 6px;
-        }
-
-        /* 菜单按钮 */
-        QPushButton#HeaderMenuBtn {
-            color: white; font-size: 22px;
-            background: transparent; border: none;
-        }
-
-        /* 日期选择框 */
-        QDateEdit {
-            min-width: 140px;
-        }
-        """
-        self.setStyleSheet(qss)
-
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(_APP_QSS)
     window = WeChatSpiderUI()
     window.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -84,8 +84,33 @@ class DatabaseInterface(abc.ABC):
         """
         pass
     
+    def save_articles(self, account_id: str, articles: List[Dict[str, Any]]) -> int:
+        """
+        批量保存文章（默认实现逐条调用save_article，具体后端可重写为单事务批量写入）
+
+        Args:
+            account_id: 账号ID
+            articles: 文章列表，每项为包含title/url/publish_time/content/details/summary的字典
+
+        Returns:
+            int: 实际新插入的文章数量
+        """
+        saved = 0
+        for article in articles:
+            if self.save_article(
+                account_id=account_id,
+                title=article.get('title', ''),
+                url=article.get('url', ''),
+                publish_time=article.get('publish_time'),
+                content=article.get('content'),
+                details=article.get('details'),
+                summary=article.get('summary')
+            ):
+                saved += 1
+        return saved
+
     @abc.abstractmethod
-    def get_articles(self, 
+    def get_articles(self,
                     account_id: Optional[str] = None, 
                     platform: Optional[str] = None,
                     start_date: Optional[str] = None, 
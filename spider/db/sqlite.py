@@ -270,7 +270,69 @@ class SQLiteDatabase(DatabaseInterface):
                 return False
             finally:
                 conn.close()
-    
+
+    def save_articles(self, account_id: str, articles: List[Dict[str, Any]]) -> int:
+        """批量保存文章：复用一条连接，executemany一次提交
+
+        逐条调用save_article时每篇文章都要开连接、查重、单独commit，
+        批量场景下fsync次数与文章数成正比；这里把整批写入合并为单个事务。
+        """
+        if not articles:
+            return 0
+
+        with self.lock:
+            conn = sqlite3.connect(self.db_file)
+            cursor = conn.cursor()
+            timestamp = int(time.time())
+
+            try:
+                # 一次查询找出整批中已存在的URL，避免逐条SELECT
+                urls = [article.get('url', '') for article in articles]
+                placeholders = ','.join('?' * len(urls))
+                cursor.execute(f"SELECT url FROM articles WHERE url IN ({placeholders})", urls)
+                existing_urls = {row[0] for row in cursor.fetchall()}
+
+                rows = []
+                for article in articles:
+                    url = article.get('url', '')
+                    if not url or url in existing_urls:
+                        continue
+                    existing_urls.add(url)  # 同批内去重
+
+                    publish_time = article.get('publish_time')
+                    publish_timestamp = 0
+                    if publish_time:
+                        try:
+                            dt = datetime.strptime(publish_time, "%Y-%m-%d %H:%M:%S")
+                            publish_timestamp = int(dt.timestamp())
+                        except:
+                            publish_timestamp = timestamp
+
+                    rows.append((
+                        account_id, article.get('title', ''), url,
+                        publish_time or "", publish_timestamp,
+                        article.get('content') or "", article.get('summary') or "",
+                        json.dumps(article.get('details') or {}, ensure_ascii=False),
+                        timestamp, timestamp
+                    ))
+
+                if rows:
+                    cursor.executemany('''
+                    INSERT INTO articles
+                    (account_id, title, url, publish_time, publish_timestamp, content, summary, details, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', rows)
+                    conn.commit()
+                logger.info(f"批量保存文章完成: 新增 {len(rows)} 篇，跳过 {len(articles) - len(rows)} 篇")
+                return len(rows)
+
+            except Exception as e:
+                logger.error(f"批量保存文章失败: {e}")
+                conn.rollback()
+                return 0
+            finally:
+                conn.close()
+
     def get_articles(self, account_id: Optional[str] = None, platform: Optional[str] = None,
                    start_date: Optional[str] = None, end_date: Optional[str] = None, 
                    keywords: Optional[List[str]] = None, limit: int = 100, 
@@ -16,8 +16,15 @@ import sys
 import time
 import json
 import re
+import hashlib
+import multiprocessing
+import threading
 import urllib.parse
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import numpy as np
 
 # 导入日志模块
 from spider.log.utils import logger
@@ -30,6 +37,287 @@ from spider.db.factory import DatabaseFactory
 # 新增：PDF 生成相关依赖
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
+# cookie串的单遍分词正则（name=value对，分号分隔）
+_COOKIE_RE = re.compile(r'([^=;\s]+)=([^;]*)(?:;\s*|$)')
+
+# Windows/Linux文件名非法字符替换表：str.translate是C层查表循环，
+# 对短文件名比正则替换更省（文件名清理在热路径中按篇调用）
+_FNAME_TRANS = str.maketrans({c: '_' for c in '\\/:*?"<>|'})
+
+
+# 每个渲染进程只启动一次浏览器：Chromium 冷启动约1~2秒，
+# 进程池的worker会连续渲染多篇文章，复用同一个持久化context、每篇新开page即可
+_render_playwright = None
+_render_context = None
+
+# 渲染进程内的磁盘写线程：PDF字节落盘与下一篇的页面加载重叠进行
+_render_io_pool = None
+
+
+def _get_render_io_pool():
+    global _render_io_pool
+    if _render_io_pool is None:
+        _render_io_pool = ThreadPoolExecutor(max_workers=1)
+    return _render_io_pool
+
+
+def _write_pdf_bytes(pdf_path, pdf_bytes):
+    """IO线程里的PDF落盘：失败时记日志并清掉残留的半成品
+
+    提交方不等待写入结果，磁盘满/路径不可写等错误必须在这里
+    兜住，否则会静默丢失且留下损坏文件。
+    """
+    try:
+        Path(pdf_path).write_bytes(pdf_bytes)
+        logger.info(f"PDF 生成成功: {pdf_path}")
+    except Exception as e:
+        logger.error(f"PDF 落盘失败 [{pdf_path}]: {e}")
+        try:
+            os.remove(pdf_path)
+        except OSError:
+            pass
+
+
+# 当前进程的profile槽位号：池worker在初始化时从父进程预填的队列
+# 领取0..N-1的固定编号（multiprocessing的进程名是全局递增的，
+# 不能当槽位键用），主进程直接渲染时落在main槽
+_render_slot = "main"
+
+# 渲染进程池全局复用：worker及其中缓存的浏览器跨任务保活，
+# 槽位号与profile目录因此在整个会话内稳定
+_pdf_executor = None
+
+
+def _claim_render_slot(slot_queue):
+    """池worker初始化：领取一个固定槽位号"""
+    global _render_slot
+    _render_slot = str(slot_queue.get())
+
+
+def _get_pdf_executor():
+    """获取会话级共享的PDF渲染进程池（懒创建）"""
+    global _pdf_executor
+    if _pdf_executor is None:
+        workers = min(os.cpu_count() or 1, 4)
+        slot_queue = multiprocessing.Queue()
+        for i in range(workers):
+            slot_queue.put(i)
+        _pdf_executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_claim_render_slot,
+            initargs=(slot_queue,)
+        )
+    return _pdf_executor
+
+
+def _render_profile_dir():
+    """当前渲染进程的持久化profile目录
+
+    Chromium的user-data-dir同一时刻只能被一个进程持有；worker按
+    池初始化时领到的固定槽位号分目录，目录总数有上界，且同一
+    槽位的HTTP缓存/DNS缓存在任务间与运行间都能命中
+    （公众号CSS/JS与mmbiz图片域是高度重复的）。
+    """
+    return os.path.join(os.path.expanduser("~/.cache/MediaSpider/render-profiles"), _render_slot)
+
+
+def _get_render_context():
+    """获取当前进程缓存的持久化浏览器上下文（断连时自动重建）"""
+    global _render_playwright, _render_context
+    if _render_context is None or _render_context.browser is None \
+            or not _render_context.browser.is_connected():
+        if _render_playwright is None:
+            _render_playwright = sync_playwright().start()
+        # 持久化profile：磁盘缓存与DNS缓存跨运行保留，首篇文章不再冷缓存
+        _render_context = _render_playwright.chromium.launch_persistent_context(
+            user_data_dir=_render_profile_dir(),
+            headless=True,
+            args=[
+                '--no-sandbox',  # 兼容 Linux 无沙箱环境
+                '--disable-blink-features=AutomationControlled',  # 规避自动化检测
+                '--disable-web-security',  # 兼容跨域 cookie/图片
+                '--disable-features=ImageLazyLoading',  # 禁用懒加载（关键！）
+                '--allow-running-insecure-content',  # 允许http图片（部分公众号图片是http）
+                '--disable-extensions',  # 禁用扩展，避免干扰
+                '--disable-dev-shm-usage',  # 解决内存不足问题
+                '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36'
+            ],
+            viewport={'width': 1280, 'height': 2000},  # 增大可视区域，减少懒加载触发
+            extra_http_headers={
+                'Accept-Language': 'zh-CN,zh;q=0.9',
+                'Referer': 'https://mp.weixin.qq.com/',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
+            },
+            locale='zh-CN',
+            geolocation={'latitude': 39.9042, 'longitude': 116.4074},  # 模拟国内位置
+            handle_sigint=False
+        )
+        # 路由注册在context上：对之后的所有page生效，
+        # 省掉每篇文章一次的route注册CDP往返
+        _render_context.route("**/*", _block_heavy_resources)
+    return _render_context
+
+
+def _parse_cookie_list(cookies):
+    """把请求头cookie字符串解析为Playwright格式的cookie列表
+
+    每个爬取任务只需解析一次，渲染多篇文章时直接复用同一份列表。
+    """
+    if not cookies:
+        return []
+    if isinstance(cookies, list):
+        return cookies
+    return [
+        {
+            'name': name,
+            'value': value.strip(),
+            'domain': '.weixin.qq.com',
+            'path': '/',
+            'httpOnly': True,
+            'secure': True,
+            'sameSite': 'None'
+        }
+        for name, value in _COOKIE_RE.findall(cookies)
+    ]
+
+
+# 小于该字节数的PDF视为损坏的半成品（渲染中断残留），续跑时重新生成
+_PDF_MIN_VALID_SIZE = 4096
+
+
+def _pdf_path_for(pdf_dir, cleaned_title, article_url):
+    """按文章链接哈希生成稳定的PDF保存路径
+
+    文件名带链接sha1前缀：同名文章天然不冲突（免去重名计数与
+    exists探测），且同一篇文章在多次运行中总是映射到同一路径，
+    为断点续跑的跳过判断提供稳定键。
+    """
+    digest = hashlib.sha1(article_url.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(pdf_dir, f"{cleaned_title}_{digest}.pdf")
+
+
+def _pdf_already_rendered(pdf_path):
+    """判断该路径下是否已有完整的PDF（续跑时跳过渲染）"""
+    try:
+        return os.path.getsize(pdf_path) > _PDF_MIN_VALID_SIZE
+    except OSError:
+        return False
+
+
+def _compile_keyword_pattern(keywords):
+    """把关键词列表预编译成单个忽略大小写的正则
+
+    逐词`in`判断是O(词数×文本长)的Python层循环，合并为交替正则后
+    每段文本只需一次C层扫描。
+    """
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
+
+
+# 打点/监控类请求的URL特征（对PDF内容无贡献）
+_TRACKING_URL_RE = re.compile(r'(beacon|analytics|jsmonitor|badjs|collect)')
+
+
+def _block_heavy_resources(route):
+    """渲染PDF时丢弃音视频、字体、websocket与打点请求，图片/CSS照常加载"""
+    if (route.request.resource_type in ('media', 'font', 'websocket')
+            or _TRACKING_URL_RE.search(route.request.url)):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def render_article_pdf(article_url, pdf_path, cookies=None, wait_time=10):
+    """
+    渲染单篇文章为 PDF（模块级函数，可被进程池pickle后在子进程执行）
+    """
+    page = None
+    try:
+        context = _get_render_context()
+
+        # 导入登录态 cookie（调用方通常已预解析为列表；持久化context中
+        # cookie跨篇复用，重复add是幂等覆盖）
+        cookie_list = _parse_cookie_list(cookies)
+        if cookie_list:
+            context.add_cookies(cookie_list)
+
+        # 访问文章 URL（重资源拦截路由已注册在context上）
+        # DOM就绪即可往下走：图片是否加载完由后面的complete等待把关，
+        # 不必等Chromium在广告请求收尾后才触发的load事件
+        page = context.new_page()
+        page.goto(
+            article_url,
+            wait_until='domcontentloaded',
+            timeout=120000
+        )
+
+        # 步骤1：等待核心内容区域加载
+        try:
+            page.wait_for_selector('#js_content', timeout=30000)
+        except PlaywrightTimeoutError:
+            pass
+
+        # 步骤2：视口一次拉高到整页高度——全部懒加载图片同帧进入
+        # 视口、IntersectionObserver一次性触发，省掉逐段滚动的等待
+        doc_height = page.evaluate("document.documentElement.scrollHeight")
+        page.set_viewport_size({'width': 1280, 'height': min(int(doc_height), 32000)})
+
+        # 等待全部图片加载（img.complete事件驱动，而非按页面高度硬编码sleep）
+        page.evaluate("""async () => {
+            // 解除原生懒加载，保证所有图片立即开始请求
+            document.querySelectorAll('img[loading="lazy"]')
+                .forEach(img => { img.loading = 'eager'; });
+            await Promise.all(Array.from(document.images).map(
+                img => img.complete ? Promise.resolve()
+                    : new Promise(res => { img.onload = img.onerror = res; })
+            ));
+        }""")
+
+        # 步骤3：短暂稳定等待（兜底懒加载替换）
+        page.wait_for_timeout(1000)
+
+        # 步骤4：内容就绪后冻结页面再打印——清掉所有定时器、
+        # 摘除视频与广告iframe，布局树变小变静态，分页/绘制更快
+        # （page.pdf本身默认即按print媒体渲染，无需再emulate_media）
+        page.evaluate("""() => {
+            let id = window.setTimeout(() => {}, 0);
+            while (id--) { clearTimeout(id); clearInterval(id); }
+            document.querySelectorAll('video, iframe[src*="ad"]')
+                .forEach(n => n.remove());
+            // 公众号正文图片都是<img>，背景图只是装饰：打印前摘掉，
+            // 打印管线少一层位图栅格化，输出文件也更小
+            document.querySelectorAll('*').forEach(e => {
+                if (getComputedStyle(e).backgroundImage !== 'none') {
+                    e.style.backgroundImage = 'none';
+                }
+            });
+        }""")
+
+        # 生成 PDF：取回字节后交给IO线程落盘，当前worker可立即渲染下一篇
+        pdf_bytes = page.pdf(
+            format='A4',
+            margin={'top': '15mm', 'bottom': '15mm', 'left': '10mm', 'right': '10mm'},
+            print_background=True,
+            display_header_footer=False,
+            scale=1.0
+        )
+        _get_render_io_pool().submit(_write_pdf_bytes, pdf_path, pdf_bytes)
+
+        return True
+
+    except Exception as e:
+        logger.error(f"生成 PDF 失败 [{article_url}]: {str(e)}")
+        if os.path.exists(pdf_path):
+            os.remove(pdf_path)
+        return False
+    finally:
+        if page is not None:
+            try:
+                page.close()
+            except Exception:
+                pass
+
 
 class WeChatSpiderRunner:
     """微信爬虫运行器，封装爬虫的主要功能（新增 PDF 生成与中断控制）"""
@@ -37,147 +325,37 @@ class WeChatSpiderRunner:
     def __init__(self):
         """初始化爬虫运行器"""
         self.login_manager = WeChatSpiderLogin()
-        # 新增：运行控制标志位
-        self.keep_running = True
+        # 运行控制改用Event：等待间隔可被stop()立即打断，
+        # 停止延迟从最长一个interval降为0
+        self._stop_event = threading.Event()
+
+    @property
+    def keep_running(self):
+        """当前任务是否继续运行（兼容原布尔标志的读取方式）"""
+        return not self._stop_event.is_set()
 
     def stop(self):
         """停止当前任务"""
         logger.warning("收到停止指令，正在终止任务...")
-        self.keep_running = False
+        self._stop_event.set()
 
     def reset_stop(self):
         """重置运行状态"""
-        self.keep_running = True
+        self._stop_event.clear()
 
     def _clean_filename(self, filename):
         """清理文件名，移除非法字符并限制长度"""
-        # 移除 Windows/Linux 非法字符
-        illegal_chars = r'[\\/:*?"<>|]'
-        cleaned = re.sub(illegal_chars, '_', filename.strip())
         # 限制最大长度（避免系统限制）
-        return cleaned[:80]
+        return filename.strip().translate(_FNAME_TRANS)[:80]
 
     def _generate_article_pdf(self, article_url, pdf_path, cookies=None, wait_time=10):
         """
-        生成微信公众号文章的 PDF（最终版：修复所有参数错误 + 图片懒加载问题）
+        生成微信公众号文章的 PDF（进程内直接渲染，保留中断检查）
         """
         # 如果已被终止，直接返回
         if not self.keep_running:
             return False
-
-        try:
-            with sync_playwright() as p:
-                # 启动浏览器（优化配置：强制允许图片加载、禁用资源拦截）
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',  # 兼容 Linux 无沙箱环境
-                        '--disable-blink-features=AutomationControlled',  # 规避自动化检测
-                        '--disable-web-security',  # 兼容跨域 cookie/图片
-                        '--disable-features=ImageLazyLoading',  # 禁用懒加载（关键！）
-                        '--allow-running-insecure-content',  # 允许http图片（部分公众号图片是http）
-                        '--disable-extensions',  # 禁用扩展，避免干扰
-                        '--disable-dev-shm-usage',  # 解决内存不足问题
-                        '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36'
-                    ],
-                    handle_sigint=False
-                )
-
-                # 创建浏览器上下文
-                context = browser.new_context(
-                    viewport={'width': 1280, 'height': 2000},  # 增大可视区域，减少懒加载触发
-                    extra_http_headers={
-                        'Accept-Language': 'zh-CN,zh;q=0.9',
-                        'Referer': 'https://mp.weixin.qq.com/',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                        'Cache-Control': 'no-cache',
-                        'Pragma': 'no-cache'
-                    },
-                    locale='zh-CN',
-                    geolocation={'latitude': 39.9042, 'longitude': 116.4074}  # 模拟国内位置
-                )
-
-                # 导入登录态 cookie
-                if cookies:
-                    cookie_list = []
-                    if isinstance(cookies, str):
-                        # 解析 cookie 字符串为 Playwright 格式
-                        for cookie_str in cookies.split('; '):
-                            if '=' not in cookie_str:
-                                continue
-                            name, value = cookie_str.split('=', 1)
-                            cookie_list.append({
-                                'name': name.strip(),
-                                'value': value.strip(),
-                                'domain': '.weixin.qq.com',
-                                'path': '/',
-                                'httpOnly': True,
-                                'secure': True,
-                                'sameSite': 'None'
-                            })
-                    elif isinstance(cookies, list):
-                        cookie_list = cookies
-
-                    if cookie_list:
-                        context.add_cookies(cookie_list)
-
-                # 访问文章 URL
-                page = context.new_page()
-                page.route("**/*", lambda route: route.continue_())
-
-                page.goto(
-                    article_url,
-                    wait_until='load',
-                    timeout=120000
-                )
-
-                # 步骤1：等待核心内容区域加载
-                try:
-                    page.wait_for_selector('#js_content', timeout=30000)
-                except PlaywrightTimeoutError:
-                    pass
-
-                # 步骤2：模拟页面滚动
-                scroll_height = page.evaluate("document.documentElement.scrollHeight")
-                for i in range(0, int(scroll_height), 500):
-                    # 中断检查：如果用户点击停止，在滚动过程中退出
-                    if not self.keep_running:
-                        browser.close()
-                        return False
-                    page.evaluate(f"window.scrollTo(0, {i})")
-                    page.wait_for_timeout(500)
-
-                page.evaluate("window.scrollTo(0, document.documentElement.scrollHeight)")
-                page.wait_for_timeout(1000)
-
-                # 步骤4：显式等待所有图片元素加载完成
-                try:
-                    page.wait_for_selector('#js_content img', state='attached', timeout=wait_time * 1000)
-                except PlaywrightTimeoutError:
-                    pass
-
-                # 步骤5：基础等待（兜底）
-                page.wait_for_timeout(wait_time * 1000)
-
-                # 生成 PDF
-                page.pdf(
-                    path=pdf_path,
-                    format='A4',
-                    margin={'top': '15mm', 'bottom': '15mm', 'left': '10mm', 'right': '10mm'},
-                    print_background=True,
-                    display_header_footer=False,
-                    scale=1.0
-                )
-
-                browser.close()
-                logger.info(f"PDF 生成成功: {pdf_path}")
-                return True
-
-        except Exception as e:
-            logger.error(f"生成 PDF 失败 [{article_url}]: {str(e)}")
-            if os.path.exists(pdf_path):
-                os.remove(pdf_path)
-            return False
+        return render_article_pdf(article_url, pdf_path, cookies, wait_time)
 
     def login(self):
         """登录微信公众平台并获取 token 和 cookie"""
@@ -248,39 +426,38 @@ class WeChatSpiderRunner:
             pages
         )
 
-        # 1. 按日期过滤
-        filtered_articles = []
-        if start_date and end_date:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d").date()
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d").date()
-            for article in articles:
-                try:
-                    publish_date = datetime.fromtimestamp(article.get('publish_timestamp', 0)).date()
-                    if start_dt <= publish_date <= end_dt:
-                        filtered_articles.append(article)
-                except:
-                    pass
-        else:
-            filtered_articles = articles
-
-        # 2. 按关键词筛选
-        if keywords:
-            keyword_filtered = []
-            for article in filtered_articles:
-                title = article.get('title', '').lower()
-                digest = article.get('digest', '').lower()
-                match = False
-                for kw in keywords:
-                    if kw.lower() in title or kw.lower() in digest:
-                        match = True
-                        break
-                if match:
-                    keyword_filtered.append(article)
-            filtered_articles = keyword_filtered
+        # 1. 按日期过滤（时间戳向量化比较，避免逐篇datetime.fromtimestamp）
+        filtered_articles = articles
+        if start_date and end_date and articles:
+            # fromisoformat是专用C解析路径，比strptime的通用格式解释快数倍
+            start_ts = int(datetime.combine(date.fromisoformat(start_date), datetime.min.time()).timestamp())
+            # 结束日期按整天计算（含当天最后一秒）
+            end_ts = int(datetime.combine(date.fromisoformat(end_date) + timedelta(days=1), datetime.min.time()).timestamp()) - 1
+            ts_arr = np.fromiter(
+                (article.get('publish_timestamp', 0) for article in articles),
+                dtype=np.int64, count=len(articles)
+            )
+            keep_idx = np.nonzero((ts_arr >= start_ts) & (ts_arr <= end_ts))[0]
+            filtered_articles = [articles[i] for i in keep_idx]
+
+        # 2. 按关键词筛选（预编译正则，每篇文章标题+摘要各扫一遍）
+        keyword_pattern = _compile_keyword_pattern(keywords)
+        if keyword_pattern:
+            filtered_articles = [
+                article for article in filtered_articles
+                if keyword_pattern.search(article.get('title', ''))
+                or keyword_pattern.search(article.get('digest', ''))
+            ]
+
+        # 空结果提前返回：不创建PDF目录、不解析cookie、不起进程池
+        if (include_content or generate_pdf) and not filtered_articles:
+            if progress_callback: progress_callback(100, "无符合条件的文章")
+            return {"success": True, "msg": "无符合条件的文章", "data": {"count": 0}}
 
         # PDF 输出设置
         pdf_dir = None
-        login_cookies = headers.get('cookie', '')
+        # cookie解析一次，之后每篇渲染直接复用
+        login_cookies = _parse_cookie_list(headers.get('cookie', ''))
         if generate_pdf:
             if not pdf_output_dir:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -293,47 +470,83 @@ class WeChatSpiderRunner:
 
         if include_content or generate_pdf:
             total_articles = len(filtered_articles)
-            if total_articles == 0:
-                if progress_callback: progress_callback(100, "无符合条件的文章")
-                return {"success": True, "msg": "无符合条件的文章", "data": {"count": 0}}
+
+            # PDF渲染走共享进程池：渲染与内容抓取重叠进行，互不阻塞，
+            # worker中的浏览器在任务之间保活
+            pdf_executor = None
+            pdf_futures = {}
+            if generate_pdf:
+                pdf_executor = _get_pdf_executor()
+
+            # 抓取阶段进度占比：需要渲染PDF时留出30%给渲染等待阶段
+            fetch_span = 40 if generate_pdf else 70
 
             for i, article in enumerate(filtered_articles):
                 # ------------------- 中断检查点 -------------------
                 if not self.keep_running:
                     logger.warning("用户停止了爬取任务，正在保存已完成的数据...")
                     if progress_callback:
-                        progress_callback(int(30 + (i) / total_articles * 70), "任务已手动停止")
+                        progress_callback(int(30 + (i) / total_articles * fetch_span), "任务已手动停止")
                     break
                 # ------------------------------------------------
 
                 article_title = article.get('title', f"未知文章_{i + 1}")
                 if progress_callback:
-                    content_percent = int(30 + (i + 1) / total_articles * 70)
+                    content_percent = int(30 + (i + 1) / total_articles * fetch_span)
                     progress_callback(content_percent, f"处理第 {i + 1}/{total_articles} 篇：{article_title}")
 
                 # 获取内容
                 if include_content:
                     article = scraper.get_article_content_by_url(article)
 
-                # 生成 PDF
+                # 提交 PDF 渲染任务（不等待结果，继续抓取下一篇）
                 if generate_pdf and article.get('link'):
                     cleaned_title = self._clean_filename(article_title)
-                    pdf_path = os.path.join(pdf_dir, f"{cleaned_title}.pdf")
-                    counter = 1
-                    while os.path.exists(pdf_path):
-                        pdf_path = os.path.join(pdf_dir, f"{cleaned_title}_{counter}.pdf")
-                        counter += 1
+                    pdf_path = _pdf_path_for(pdf_dir, cleaned_title, article['link'])
 
-                    success = self._generate_article_pdf(article['link'], pdf_path, login_cookies)
-                    if success:
+                    if _pdf_already_rendered(pdf_path):
+                        # 断点续跑：该链接的PDF已在磁盘上，跳过渲染
                         article['pdf_path'] = pdf_path
                     else:
                         article['pdf_path'] = ''
+                        future = pdf_executor.submit(render_article_pdf, article['link'], pdf_path, login_cookies)
+                        pdf_futures[future] = (article, pdf_path)
 
                 final_processed_articles.append(article)
 
                 if i < len(filtered_articles) - 1:
-                    time.sleep(interval)
+                    # 可中断的间隔等待：stop()会立刻唤醒并结束循环
+                    if self._stop_event.wait(interval):
+                        continue
+
+            # 等待进程池中剩余的 PDF 渲染完成
+            if pdf_executor is not None:
+                if not self.keep_running:
+                    # 已停止：放弃尚未开始的渲染任务
+                    for future in pdf_futures:
+                        future.cancel()
+
+                total_pdf = len(pdf_futures)
+                done_pdf = 0
+                for future in as_completed(list(pdf_futures)):
+                    article, pdf_path = pdf_futures[future]
+                    success = False
+                    if not future.cancelled():
+                        try:
+                            success = future.result()
+                        except Exception as e:
+                            logger.error(f"PDF 渲染任务异常 [{pdf_path}]: {e}")
+                    if success:
+                        article['pdf_path'] = pdf_path
+
+                    done_pdf += 1
+                    if progress_callback and self.keep_running:
+                        pdf_percent = int(70 + done_pdf / total_pdf * 30)
+                        progress_callback(pdf_percent, f"渲染 PDF {done_pdf}/{total_pdf} 篇")
+
+                if not pdf_futures and progress_callback and self.keep_running:
+                    # 续跑时可能全部命中磁盘缓存：渲染阶段无任务，进度也要走到终点
+                    progress_callback(100, "PDF 均已存在，跳过渲染")
         else:
             final_processed_articles = filtered_articles
 
@@ -415,59 +628,79 @@ class WeChatSpiderRunner:
         logger.info("开始获取批量文章列表...")
         articles = batch_scraper.start_batch_scrape(config)
 
-        # 关键词筛选
-        if keywords:
-            keyword_filtered = []
-            for article in articles:
-                title = article.get('title', '').lower()
-                digest = article.get('digest', '').lower()
-                match = False
-                for kw in keywords:
-                    if kw.lower() in title or kw.lower() in digest:
-                        match = True
-                        break
-                if match:
-                    keyword_filtered.append(article)
-            articles = keyword_filtered
+        # 关键词筛选（预编译正则，每篇文章标题+摘要各扫一遍）
+        keyword_pattern = _compile_keyword_pattern(keywords)
+        if keyword_pattern:
+            articles = [
+                article for article in articles
+                if keyword_pattern.search(article.get('title', ''))
+                or keyword_pattern.search(article.get('digest', ''))
+            ]
 
         # 第二阶段：批量生成 PDF (支持中断)
+        # 渲染只访问已拿到的文章链接，不再触发列表接口，
+        # 因此可以放进进程池并行执行，多个账号的渲染延迟相互重叠
         processed_articles = []
         if generate_pdf and articles and batch_pdf_dir:
             total_articles = len(articles)
             logger.info(f"开始为 {total_articles} 篇文章生成 PDF...")
 
+            # cookie解析一次，之后每篇渲染直接复用
+            login_cookie = _parse_cookie_list(headers.get('cookie', ''))
+            pdf_futures = {}
+            created_dirs = set()  # 每个账号目录只makedirs一次，免去逐篇stat
+            pdf_executor = _get_pdf_executor()
             for i, article in enumerate(articles):
-                # ------------------- 中断检查点 -------------------
                 if not self.keep_running:
                     logger.warning("批量任务被用户停止")
                     break
-                # ------------------------------------------------
-
-                if progress_callback:
-                    pdf_percent = int(40 + (i + 1) / total_articles * 60)
-                    progress_callback(pdf_percent, f"生成 PDF {i + 1}/{total_articles} 篇")
 
                 article_url = article.get('link')
                 account_name = article.get('name', '未知账号')
+                processed_articles.append(article)
+                if not article_url:
+                    continue
 
-                if article_url:
-                    account_pdf_dir = os.path.join(batch_pdf_dir, self._clean_filename(account_name))
+                account_pdf_dir = os.path.join(batch_pdf_dir, self._clean_filename(account_name))
+                if account_pdf_dir not in created_dirs:
                     os.makedirs(account_pdf_dir, exist_ok=True)
-
-                    cleaned_title = self._clean_filename(article.get('title', f"article_{i + 1}"))
-                    pdf_path = os.path.join(account_pdf_dir, f"{cleaned_title}.pdf")
-                    counter = 1
-                    while os.path.exists(pdf_path):
-                        pdf_path = os.path.join(account_pdf_dir, f"{cleaned_title}_{counter}.pdf")
-                        counter += 1
-
-                    success = self._generate_article_pdf(article_url, pdf_path, headers.get('cookie', ''))
-                    if success:
-                        article['pdf_path'] = pdf_path
-
-                processed_articles.append(article)
-                if i < len(articles) - 1:
-                    time.sleep(interval / 2)
+                    created_dirs.add(account_pdf_dir)
+
+                cleaned_title = self._clean_filename(article.get('title', f"article_{i + 1}"))
+                pdf_path = _pdf_path_for(account_pdf_dir, cleaned_title, article_url)
+
+                if _pdf_already_rendered(pdf_path):
+                    # 断点续跑：该链接的PDF已在磁盘上，跳过渲染
+                    article['pdf_path'] = pdf_path
+                    continue
+
+                future = pdf_executor.submit(render_article_pdf, article_url, pdf_path, login_cookie)
+                pdf_futures[future] = (article, pdf_path)
+
+            if not self.keep_running:
+                # 已停止：放弃尚未开始的渲染任务，只等待在途的完成
+                for future in pdf_futures:
+                    future.cancel()
+
+            total_pdf = len(pdf_futures)
+            done_pdf = 0
+            for future in as_completed(list(pdf_futures)):
+                article, pdf_path = pdf_futures[future]
+                if not future.cancelled():
+                    try:
+                        if future.result():
+                            article['pdf_path'] = pdf_path
+                    except Exception as e:
+                        logger.error(f"PDF 渲染任务异常 [{pdf_path}]: {e}")
+
+                done_pdf += 1
+                if progress_callback and self.keep_running:
+                    pdf_percent = int(40 + done_pdf / total_pdf * 60)
+                    progress_callback(pdf_percent, f"生成 PDF {done_pdf}/{total_pdf} 篇")
+
+            if not pdf_futures and progress_callback and self.keep_running:
+                # 续跑时可能全部命中磁盘缓存：渲染阶段无任务，进度也要走到终点
+                progress_callback(100, "PDF 均已存在，跳过渲染")
         else:
             processed_articles = articles
 
@@ -215,9 +215,9 @@ class WeChatScraper:
         
         # 解析日期
         if isinstance(start_date, str):
-            start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+            start_date = date.fromisoformat(start_date)
         if isinstance(end_date, str):
-            end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+            end_date = date.fromisoformat(end_date)
         
         filtered_articles = []
         for article in articles:
@@ -371,8 +371,8 @@ class BatchWeChatScraper:
         
         # 解析日期
         try:
-            start_date = datetime.strptime(config['start_date'], '%Y-%m-%d').date()
-            end_date = datetime.strptime(config['end_date'], '%Y-%m-%d').date()
+            start_date = date.fromisoformat(config['start_date'])
+            end_date = date.fromisoformat(config['end_date'])
         except:
             self._trigger_error("系统", "日期格式错误，应为YYYY-MM-DD")
             return []
@@ -22,6 +22,7 @@ import random
 import time
 import os
 import csv
+import threading
 from datetime import datetime
 from tqdm import tqdm
 import bs4
@@ -30,6 +31,33 @@ from markdownify import MarkdownConverter
 # 导入日志模块
 from spider.log.utils import logger
 
+# 模块级会话：搜索/文章列表/正文都是同域名的JSON或HTML接口，
+# 复用一条keep-alive连接可以省掉每次请求的TCP/TLS握手开销
+_session = requests.Session()
+
+# 自适应请求间隔：触发限流(429)后指数退避，正常响应后缓慢衰减回最小值，
+# 避免被限流后整页重爬浪费带宽
+_MIN_REQUEST_DELAY = 2.0
+_MAX_REQUEST_DELAY = 60.0
+_adaptive_delay = {"value": _MIN_REQUEST_DELAY}
+_delay_lock = threading.Lock()
+
+
+def note_response_status(status_code):
+    """根据响应状态码调整自适应请求间隔"""
+    with _delay_lock:
+        if status_code == 429:
+            _adaptive_delay["value"] = min(_adaptive_delay["value"] * 2, _MAX_REQUEST_DELAY)
+            logger.warning(f"触发限流(429)，请求间隔退避至 {_adaptive_delay['value']:.1f} 秒")
+        elif status_code == 200:
+            _adaptive_delay["value"] = max(_MIN_REQUEST_DELAY, _adaptive_delay["value"] * 0.9)
+
+
+def get_request_delay():
+    """获取当前自适应请求间隔（秒）"""
+    with _delay_lock:
+        return _adaptive_delay["value"]
+
 
 class ImageBlockConverter(MarkdownConverter):
     """
@@ -80,7 +108,8 @@ def get_fakid(headers, tok, query):
     }
     
     # 发送请求
-    r = requests.get(url, headers=headers, params=data)
+    r = _session.get(url, headers=headers, params=data)
+    note_response_status(r.status_code)
     
     # 解析json
     dic = r.json()
@@ -131,10 +160,12 @@ def get_articles_list(page_num, start_page, fakeid, token, headers):
                 'ajax': '1',
             }
             
-            # 随机延时，避免被反爬
-            time.sleep(random.randint(1, 2))
+            # 自适应延时：触发429后的退避立即作用于本任务的下一页请求，
+            # 叠加随机抖动避免固定节奏被识别
+            time.sleep(get_request_delay() + random.random())
             
-            r = requests.get(url, headers=headers, params=data)
+            r = _session.get(url, headers=headers, params=data)
+            note_response_status(r.status_code)
             # 解析json
             dic = r.json()
             
@@ -166,7 +197,8 @@ def get_article_content(url, headers):
     """
     try:
         # 发送请求
-        response = requests.get(url, headers=headers)
+        response = _session.get(url, headers=headers)
+        note_response_status(response.status_code)
         if response.status_code != 200:
             return f"请求失败，状态码: {response.status_code}"
         
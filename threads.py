@@ -1,19 +1,90 @@
+import os
 import sys
+import time
+from dataclasses import dataclass
+import functools
+import threading
 import subprocess
-from PyQt5.QtCore import pyqtSignal, QThread
+from pathlib import Path
+from PyQt5.QtCore import pyqtSignal, QObject, QRunnable
+
+
+def _install_marker_path():
+    """首次安装成功后写入的标记文件路径（位于用户缓存目录）"""
+    if sys.platform.startswith("win32"):
+        cache_root = Path(os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData" / "Local")))
+    else:
+        cache_root = Path.home() / ".cache"
+    return cache_root / "MediaSpider" / "chromium.ok"
+
+
+def _write_install_marker():
+    """写入安装完成标记，后续启动可以完全跳过安装检查"""
+    try:
+        marker = _install_marker_path()
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except Exception:
+        # 标记写不进去也不影响功能，下次启动多走一次目录探测而已
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def browser_already_installed():
+    """探测本地缓存目录，判断playwright的chromium浏览器是否已安装
+
+    playwright会把浏览器下载到 ~/.cache/ms-playwright（Windows下为
+    %LOCALAPPDATA%\\ms-playwright），缓存命中时无需再启动安装子进程。
+    """
+    try:
+        # 首次安装成功后会写入标记文件，命中时连目录探测都省掉
+        if _install_marker_path().exists():
+            return True
+
+        if sys.platform.startswith("win32"):
+            default_dir = Path(os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData" / "Local"))) / "ms-playwright"
+        else:
+            default_dir = Path.home() / ".cache" / "ms-playwright"
+        browsers_path = Path(os.environ.get("PLAYWRIGHT_BROWSERS_PATH", str(default_dir)))
+
+        for chromium_dir in browsers_path.glob("chromium-*"):
+            # 目录下存在chrome可执行文件即视为安装完成
+            for exe_name in ("chrome.exe", "chrome"):
+                if any(chromium_dir.rglob(exe_name)):
+                    _write_install_marker()
+                    return True
+        return False
+    except Exception:
+        return False
 
 
 def install_playwright_browser(log_callback=None):
-    """安装playwright浏览器组件"""
+    """安装playwright浏览器组件（已安装时直接跳过）"""
     try:
+        # 缓存命中时跳过安装子进程，避免每次启动都联网校验版本
+        if browser_already_installed():
+            if log_callback:
+                log_callback("系统", "✅ 浏览器组件就绪（使用本地缓存）")
+            return True
+
         if log_callback:
             log_callback("系统", "正在检查并安装浏览器组件...")
-        subprocess.check_call(
+        # 逐行转发安装输出：用户能看到实时下载进度，内存占用恒定为一行
+        proc = subprocess.Popen(
             [sys.executable, "-m", "playwright", "install", "chromium"],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
         )
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line and log_callback:
+                log_callback("系统", line)
+        rc = proc.wait()
+        if rc:
+            raise RuntimeError(f"playwright install 退出码 {rc}")
+        _write_install_marker()
         if log_callback:
             log_callback("系统", "✅ 浏览器组件就绪")
             return True
@@ -24,109 +95,146 @@ def install_playwright_browser(log_callback=None):
         return False
 
 
-class BrowserInstaller(QThread):
-    """浏览器安装线程"""
+# 同一时间只允许一个任务访问mp.weixin.qq.com：搜索/爬取串行化，
+# 避免并发任务叠加请求频率而触发限流
+_WECHAT_SEM = threading.BoundedSemaphore(1)
+
+
+class InstallerSignals(QObject):
+    """浏览器安装任务信号载体"""
     log_signal = pyqtSignal(str, str)
 
+
+class BrowserInstaller(QRunnable):
+    """浏览器安装任务（提交到全局线程池执行，复用现有工作线程）"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = InstallerSignals()
+
     def run(self):
-        install_playwright_browser(self.log_signal.emit)
+        install_playwright_browser(self.signals.log_signal.emit)
 
 
-class SpiderWorker(QThread):
-    """爬虫工作线程（处理登录、搜索、爬取等任务）"""
+@dataclass(slots=True)
+class TaskResult:
+    """任务完成结果：作为单个对象穿越信号队列，避免多参数逐个编组"""
+    success: bool
+    msg: str
+    data: object = None
+
+
+class SpiderSignals(QObject):
+    """爬虫任务信号载体（QRunnable本身不支持定义信号）"""
     log_signal = pyqtSignal(str, str)
-    progress_signal = pyqtSignal(int)
-    finish_signal = pyqtSignal(bool, str, object)  # bool:success, str:msg, object:data
+    # 进度与对应日志合并为一次发射，每tick只跨线程排队一次
+    progress_log_signal = pyqtSignal(int, str, str)
+    finish_signal = pyqtSignal(object)  # TaskResult
+
+
+class SpiderWorker(QRunnable):
+    """爬虫工作任务（处理登录、搜索、爬取等任务，提交到线程池复用线程）"""
 
     def __init__(self, runner, task_type, **kwargs):
         super().__init__()
         self.runner = runner
         self.task_type = task_type
         self.kwargs = kwargs
+        self.signals = SpiderSignals()
+        self._last_pct = -1
+        self._last_pct_ts = 0.0
+
+    def _progress(self, percent, msg):
+        """节流发射进度：百分比未变且距上次不足200ms的tick直接丢弃
+
+        进度回调在后台高频触发，每次emit都要跨线程排队，
+        这里只放行有信息量的tick；100%始终放行，保证收尾可见。
+        """
+        now = time.monotonic()
+        if percent != 100 and percent == self._last_pct and now - self._last_pct_ts < 0.2:
+            return
+        self._last_pct = percent
+        self._last_pct_ts = now
+        self.signals.progress_log_signal.emit(percent, "系统", msg)
+
+    def _run_login(self):
+        login_result = self.runner.login()
+        if isinstance(login_result, bool):
+            return TaskResult(login_result, "登录成功" if login_result else "登录失败", {})
+        result = login_result or {"success": False, "msg": "登录返回异常", "data": {}}
+        return TaskResult(result["success"], result["msg"], result.get("data", {}))
+
+    def _run_search(self):
+        name = self.kwargs.get("account_name")
+        with _WECHAT_SEM:
+            result = self.runner.search_account(name)
+        if result is None:
+            result = []
+        return TaskResult(
+            True,
+            f"搜索完成，找到 {len(result)} 个匹配结果" if result else "未找到匹配公众号",
+            result
+        )
+
+    def _run_scrape(self):
+        account = self.kwargs.get("account")
+        # 请求间隔跟随自适应限流状态（触发429后会自动退避）
+        from spider.wechat.utils import get_request_delay
+        interval = self.kwargs.get("interval") or get_request_delay()
+
+        def article_progress_callback(percent, msg):
+            self._progress(percent, f"进度 {percent}% | {msg}")
+
+        with _WECHAT_SEM:
+            result = self.runner.scrape_single_account(
+                name=account['wpub_name'],
+                pages=self.kwargs.get("pages", 1),
+                start_date=self.kwargs.get("start_date"),
+                end_date=self.kwargs.get("end_date"),
+                include_content=True,
+                interval=interval,
+                generate_pdf=self.kwargs.get("generate_pdf", False),
+                pdf_output_dir=self.kwargs.get("pdf_dir", "./wechat_pdf"),
+                progress_callback=article_progress_callback,
+                keywords=self.kwargs.get("keywords", [])
+            )
+        return TaskResult(result["success"], result["msg"], result.get("data", {}))
+
+    def _run_batch_scrape(self):
+        def batch_progress_callback(percent, msg):
+            self._progress(percent, f"批量进度 {percent}% | {msg}")
+
+        with _WECHAT_SEM:
+            result = self.runner.batch_scrape(
+                accounts=self.kwargs.get("accounts", []),
+                pages=self.kwargs.get("pages", 1),
+                start_date=self.kwargs.get("start_date"),
+                end_date=self.kwargs.get("end_date"),
+                generate_pdf=self.kwargs.get("generate_pdf", False),
+                pdf_output_dir=self.kwargs.get("pdf_dir", "./wechat_pdf"),
+                progress_callback=batch_progress_callback,
+                keywords=self.kwargs.get("keywords", [])
+            )
+        return TaskResult(result["success"], result["msg"], result.get("data", {}))
+
+    # 任务类型到处理方法的查表分发：各分支统一返回TaskResult，
+    # 发射收口在run()里只写一次
+    _TASK_HANDLERS = {
+        "login": _run_login,
+        "search": _run_search,
+        "scrape": _run_scrape,
+        "batch_scrape": _run_batch_scrape,
+    }
 
     def run(self):
         # 确保每次开始任务前重置停止标志
         self.runner.reset_stop()
 
+        handler = self._TASK_HANDLERS.get(self.task_type)
         try:
-            if self.task_type == "login":
-                login_result = self.runner.login()
-                if isinstance(login_result, bool):
-                    result = {
-                        "success": login_result,
-                        "msg": "登录成功" if login_result else "登录失败",
-                        "data": {}
-                    }
-                else:
-                    result = login_result or {"success": False, "msg": "登录返回异常", "data": {}}
-                self.finish_signal.emit(result["success"], result["msg"], result.get("data", {}))
-
-
-            elif self.task_type == "search":
-                name = self.kwargs.get("account_name")
-                result = self.runner.search_account(name)
-                if result is None:
-                    result = []
-                self.finish_signal.emit(
-                    True,
-                    f"搜索完成，找到 {len(result)} 个匹配结果" if result else "未找到匹配公众号",
-                    result
-                )
-
-            elif self.task_type == "scrape":
-                account = self.kwargs.get("account")
-                pages = self.kwargs.get("pages", 1)
-                start_date = self.kwargs.get("start_date")
-                end_date = self.kwargs.get("end_date")
-                generate_pdf = self.kwargs.get("generate_pdf", False)
-                pdf_dir = self.kwargs.get("pdf_dir", "./wechat_pdf")
-                keywords = self.kwargs.get("keywords", [])
-
-                def article_progress_callback(percent, msg):
-                    self.progress_signal.emit(percent)
-                    self.log_signal.emit("系统", f"进度 {percent}% | {msg}")
-
-                result = self.runner.scrape_single_account(
-                    name=account['wpub_name'],
-                    pages=pages,
-                    start_date=start_date,
-                    end_date=end_date,
-                    include_content=True,
-                    generate_pdf=generate_pdf,
-                    pdf_output_dir=pdf_dir,
-                    progress_callback=article_progress_callback,
-                    keywords=keywords
-                )
-                self.finish_signal.emit(result["success"], result["msg"], result.get("data", {}))
-
-            elif self.task_type == "batch_scrape":
-                accounts = self.kwargs.get("accounts", [])
-                pages = self.kwargs.get("pages", 1)
-                start_date = self.kwargs.get("start_date")
-                end_date = self.kwargs.get("end_date")
-                generate_pdf = self.kwargs.get("generate_pdf", False)
-                pdf_dir = self.kwargs.get("pdf_dir", "./wechat_pdf")
-                keywords = self.kwargs.get("keywords", [])
-
-                def batch_progress_callback(percent, msg):
-                    self.progress_signal.emit(percent)
-                    self.log_signal.emit("系统", f"批量进度 {percent}% | {msg}")
-
-                result = self.runner.batch_scrape(
-                    accounts=accounts,
-                    pages=pages,
-                    start_date=start_date,
-                    end_date=end_date,
-                    generate_pdf=generate_pdf,
-                    pdf_output_dir=pdf_dir,
-                    progress_callback=batch_progress_callback,
-                    keywords=keywords
-                )
-                self.finish_signal.emit(result["success"], result["msg"], result.get("data", {}))
-
+            if handler is not None:
+                self.signals.finish_signal.emit(handler(self))
         except Exception as e:
-            self.finish_signal.emit(
-                False,
-                f"线程执行出错：{str(e)}",
-                None
+            self.signals.finish_signal.emit(
+                TaskResult(False, f"线程执行出错：{str(e)}")
             )
\ No newline at end of file
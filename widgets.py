@@ -1,41 +1,87 @@
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QSizePolicy
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QFont, QPainter, QPixmap
+
+# 对齐标志的按位或只算一次，气泡构造时直接取常量
+_ALIGN_MSG = Qt.AlignLeft | Qt.AlignTop
+
+# 消息字体共享一个QFont实例：字体库的替换链解析与度量缓存
+# 只在首个气泡时发生，后续气泡直接命中
+_MSG_FONT = None
+
+
+def _msg_font():
+    global _MSG_FONT
+    if _MSG_FONT is None:
+        _MSG_FONT = QFont("Microsoft YaHei")
+        _MSG_FONT.setPixelSize(15)
+    return _MSG_FONT
 
 
 class ChatBubble(QWidget):
-    """自定义聊天气泡组件"""
+    """自定义聊天气泡组件
+
+    消息样式统一定义在全局样式表中（按objectName匹配），
+    图标为类级共享的预渲染位图，避免每条日志都触发一次
+    Qt的CSS解析与圆角绘制。
+    """
+
+    # 图标位图懒构建后全体气泡共享（QPixmap构建需要QApplication已存在）
+    _ICON_PX = None
+
+    @classmethod
+    def _icon_pixmap(cls):
+        """预渲染36×36的圆形图标位图
+
+        图标内容恒定，用QPainter一次画进QPixmap后按引用复用，
+        省掉样式引擎逐气泡计算border-radius裁剪路径的开销。
+        """
+        if cls._ICON_PX is None:
+            px = QPixmap(36, 36)
+            px.fill(Qt.transparent)
+            painter = QPainter(px)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("#e2e8f0"))
+            painter.drawEllipse(0, 0, 36, 36)
+            font = QFont()
+            font.setPixelSize(16)
+            font.setBold(True)
+            painter.setFont(font)
+            painter.setPen(QColor("#1e293b"))
+            painter.drawText(px.rect(), Qt.AlignCenter, "🔰")
+            painter.end()
+            cls._ICON_PX = px
+        return cls._ICON_PX
+
     def __init__(self, role, text, parent=None):
         super().__init__(parent)
         self.layout = QHBoxLayout()
         self.layout.setContentsMargins(10, 8, 10, 8)
 
-        self.icon_label = QLabel("🔰")
+        self.icon_label = QLabel()
+        self.icon_label.setPixmap(self._icon_pixmap())
         self.icon_label.setFixedSize(36, 36)
         self.icon_label.setAlignment(Qt.AlignCenter)
-        self.icon_label.setStyleSheet("""
-            background-color: #e2e8f0; border-radius: 18px; color: #1e293b; font-weight: bold;
-            font-family: "Microsoft YaHei", "SimSun", sans-serif; 
-            font-size: 16px;
-        """)
 
         self.msg_label = QLabel(text)
+        self.msg_label.setObjectName("ChatBubbleMsg")
+        self.msg_label.setFont(_msg_font())
+        # 日志都是纯文本：显式声明后Qt跳过富文本探测，
+        # 不会为疑似HTML的内容构建QTextDocument排版
+        self.msg_label.setTextFormat(Qt.PlainText)
         self.msg_label.setWordWrap(True)
-        self.msg_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        self.msg_label.setStyleSheet("""
-            QLabel {
-                padding: 12px 18px;
-                border-radius: 8px;
-                font-size: 15px;
-                line-height: 1.5;
-                background-color: #f1f5f9;
-                color: #333333;
-                font-family: "Microsoft YaHei", "SimSun", sans-serif;
-            }
-        """)
+        self.msg_label.setAlignment(_ALIGN_MSG)
 
         self.layout.addWidget(self.icon_label)
         self.layout.addWidget(self.msg_label)
         self.setLayout(self.layout)
 
+        # 显式声明尺寸策略：高度固定为hint、消息横向撑满，
+        # 列表布局协商时少来回询问几轮sizeHint
+        self.msg_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        self.setMinimumHeight(52)
+
     def sizeHint(self):
-        return self.layout.sizeHint()
\ No newline at end of file
+        return self.layout.sizeHint()